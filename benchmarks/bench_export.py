@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+
+# each startup path runs in a fresh interpreter so import cost and peak memory are measured separately
+BUILDER_STARTUP = """
+import resource, time
+start_time = time.perf_counter()
+import numpy as np
+from benchmarks.bench_export import create_root_system
+root_system = create_root_system()
+root_system.model.predict(np.random.rand(1, {input_units}))
+print(time.perf_counter() - start_time, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+RUNNER_STARTUP = """
+import resource, time
+start_time = time.perf_counter()
+import numpy as np
+from neuraltree.runner import FrozenTreeRunner
+runner = FrozenTreeRunner({frozen_graph_path!r})
+runner.predict(np.random.rand(1, {input_units}).astype("float32"))
+print(time.perf_counter() - start_time, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+INPUT_UNITS = 256
+HIDDEN_UNITS = 1024
+OUTPUT_UNITS = 10
+
+
+def create_root_system():
+    from keras.layers import Input, Dense
+    from keras.models import Model
+
+    from neuraltree.builder import \
+        get_name_to_unlinked_layer_dict, \
+        get_incoming_and_outgoing_layers, \
+        get_input_and_output_layers, \
+        RootSystemBuilder
+    from neuraltree.model import RootSystem
+
+    input_layer = Input(shape=(INPUT_UNITS,))
+    hidden_layer_linked = Dense(units=HIDDEN_UNITS, activation="relu")(input_layer)
+    hidden_layer_linked = Dense(units=HIDDEN_UNITS, activation="relu")(hidden_layer_linked)
+    output_layer_linked = Dense(units=OUTPUT_UNITS)(hidden_layer_linked)
+    model = Model(inputs=[input_layer], outputs=[output_layer_linked])
+
+    incoming_layers_by_name, \
+        outgoing_layers_by_name, \
+        layer_build_order_by_name = get_incoming_and_outgoing_layers(model)
+
+    input_layers, output_layers = get_input_and_output_layers(model)
+    return RootSystem("", RootSystemBuilder(
+        get_name_to_unlinked_layer_dict(model),
+        incoming_layers_by_name,
+        outgoing_layers_by_name,
+        layer_build_order_by_name,
+        input_layers,
+        output_layers
+    ))
+
+
+def run_startup(script):
+    output = subprocess.check_output([sys.executable, "-c", script], cwd=os.getcwd())
+    seconds, max_rss_kb = output.decode("utf-8").strip().splitlines()[-1].split()
+    return float(seconds), int(max_rss_kb) / 1024
+
+
+def main():
+    from neuraltree.export import export_frozen_graph
+
+    export_dir = tempfile.mkdtemp()
+    frozen_graph_path = export_frozen_graph(create_root_system(), export_dir)
+
+    print("{:>10} {:>12} {:>14}".format("startup", "seconds", "peak rss (mb)"))
+    for startup_name, script in [
+        ("builder", BUILDER_STARTUP.format(input_units=INPUT_UNITS)),
+        ("runner", RUNNER_STARTUP.format(frozen_graph_path=frozen_graph_path, input_units=INPUT_UNITS))
+    ]:
+        print("{:>10} {:>12.2f} {:>14.1f}".format(startup_name, *run_startup(script)))
+
+
+if __name__ == "__main__":
+    main()
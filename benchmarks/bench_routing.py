@@ -0,0 +1,68 @@
+import time
+import numpy as np
+
+from keras.layers import Input, Dense, Average
+from keras.models import Model
+
+from neuraltree.routing import TopKBranchRouter
+
+
+INPUT_UNITS = 64
+HIDDEN_UNITS = 256
+OUTPUT_UNITS = 10
+
+BRANCH_COUNTS = [2, 4, 8, 16, 32]
+SAMPLE_COUNT = 8192
+BATCH_SIZE = 256
+
+
+def create_branch_model():
+    input_layer = Input(shape=(HIDDEN_UNITS,))
+    hidden_layer_linked = Dense(units=HIDDEN_UNITS, activation="relu")(input_layer)
+    output_layer_linked = Dense(units=OUTPUT_UNITS)(hidden_layer_linked)
+
+    return Model(inputs=[input_layer], outputs=[output_layer_linked])
+
+
+def create_trunk_outputs():
+    input_layer = Input(shape=(INPUT_UNITS,))
+    return input_layer, Dense(units=HIDDEN_UNITS, activation="relu")(input_layer)
+
+
+def create_dense_model(branch_count):
+    input_layer, trunk_output = create_trunk_outputs()
+    branch_outputs = [create_branch_model()(trunk_output) for _ in range(branch_count)]
+
+    return Model(inputs=[input_layer], outputs=[Average()(branch_outputs)])
+
+
+def create_routed_model(branch_count, k):
+    input_layer, trunk_output = create_trunk_outputs()
+    router = TopKBranchRouter([create_branch_model() for _ in range(branch_count)], k=k)
+
+    return Model(inputs=[input_layer], outputs=[router(trunk_output)])
+
+
+def get_samples_per_second(model, X):
+    model.predict(X, batch_size=BATCH_SIZE)
+
+    start_time = time.perf_counter()
+    model.predict(X, batch_size=BATCH_SIZE)
+    return len(X) / (time.perf_counter() - start_time)
+
+
+def main():
+    X = np.random.rand(SAMPLE_COUNT, INPUT_UNITS).astype("float32")
+
+    print("{:>8} {:>14} {:>14} {:>14}".format("branches", "dense", "top-1", "top-2"))
+    for branch_count in BRANCH_COUNTS:
+        print("{:>8} {:>14.0f} {:>14.0f} {:>14.0f}".format(
+            branch_count,
+            get_samples_per_second(create_dense_model(branch_count), X),
+            get_samples_per_second(create_routed_model(branch_count, 1), X),
+            get_samples_per_second(create_routed_model(branch_count, 2), X)
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -59,6 +59,37 @@ def get_layers_from_names(name_to_layer: dict, layer_names: list) -> list:
     return neural_layers
 
 
+def fold_transition_layers(neural_builder) -> list:
+    # a transition Reshape is the identity when the layer it feeds takes flat input, so it can be skipped
+    folded_layer_names = []
+    reshaped_transition_layer_names = [
+        name for name in neural_builder.incoming_layers_by_name
+        if name.endswith("_transition_layer_reshaped")
+    ]
+
+    for reshaped_name in reshaped_transition_layer_names:
+        outgoing_layer_names = neural_builder.outgoing_layers_by_name.get(reshaped_name, [])
+        outgoing_layers = get_layers_from_names(neural_builder.name_to_unlinked_layer, outgoing_layer_names)
+        if any(len(outgoing_layer.input_shape) != 2 for outgoing_layer in outgoing_layers):
+            continue
+
+        transition_name = neural_builder.incoming_layers_by_name.pop(reshaped_name)[0]
+        neural_builder.outgoing_layers_by_name[transition_name] = \
+            neural_builder.outgoing_layers_by_name.pop(reshaped_name, [])
+
+        for outgoing_layer_name in outgoing_layer_names:
+            incoming_layer_names = neural_builder.incoming_layers_by_name[outgoing_layer_name]
+            incoming_layer_names[incoming_layer_names.index(reshaped_name)] = transition_name
+
+        neural_builder.name_to_unlinked_layer.pop(reshaped_name, None)
+        if reshaped_name in neural_builder.layer_build_order_by_name:
+            neural_builder.layer_build_order_by_name.remove(reshaped_name)
+
+        folded_layer_names.append(reshaped_name)
+
+    return folded_layer_names
+
+
 def get_name_to_unlinked_layer_dict(model):
     name_to_unlinked_layer = {layer.name: layer for layer in model.layers}
     for input_layer in model.inputs:
@@ -109,6 +140,36 @@ def get_input_and_output_layers(model):
     return model.inputs, model.outputs
 
 
+def get_chained_model(models: list):
+    # links each model's outputs to the next model's inputs, e.g. roots -> trunk -> branches
+    outputs = models[0].outputs
+    for model in models[1:]:
+        outputs = model(outputs if len(outputs) > 1 else outputs[0])
+        if not isinstance(outputs, list):
+            outputs = [outputs]
+
+    return Model(inputs=models[0].inputs, outputs=outputs)
+
+
+TREE_SYSTEM_ATTR_NAMES = ["root_system", "trunk_system", "branch_system"]
+
+
+def get_tree_systems(tree) -> list:
+    # a tree is evaluated by chaining its systems' models in this order
+    return [getattr(tree, system_attr_name) for system_attr_name in TREE_SYSTEM_ATTR_NAMES]
+
+
+def get_tree_inference_model(tree):
+    return get_chained_model([neural_system.model for neural_system in get_tree_systems(tree)])
+
+
+def as_output_list(outputs) -> list:
+    if isinstance(outputs, list):
+        return outputs
+
+    return [outputs]
+
+
 class NeuralBuilder(abc.ABC):
     def __init__(self,
                  name_to_unlinked_layer: dict,
@@ -156,8 +217,14 @@ class NeuralBuilder(abc.ABC):
 
             name_to_linked_layer[name] = curr_layer_connected
 
+        # outputs come from the relinked layers, so changes to the builder's dicts show up in the built model
+        output_layers = [
+            name_to_linked_layer.get(parse_out_unlinked_name(output_layer.name), output_layer)
+            for output_layer in self.output_layers
+        ]
+
         # TODO: call model.compile to add optimizer, loss and metrics
-        return Model(inputs=self.input_layers, output=self.output_layers)
+        return Model(inputs=self.input_layers, output=output_layers)
 
     def import_dicts(self, imported_neural_arch):
         self.__import_dict_by_attr_name(imported_neural_arch, "name_to_unlinked_layer")
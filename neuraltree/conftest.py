@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+from keras.layers import Input, Dense
+from keras.models import Model
+
+from neuraltree.builder import \
+    get_name_to_unlinked_layer_dict, \
+    get_incoming_and_outgoing_layers, \
+    get_input_and_output_layers, \
+    RootSystemBuilder, BranchSystemBuilder, TrunkBuilder
+from neuraltree.model import RootSystem, BranchSystem, TrunkSystem
+
+
+def create_sample_model(input_units, hidden_units, output_units, head_count=1):
+    input_layer = Input(shape=(input_units,))
+    hidden_layer_linked = Dense(units=hidden_units, activation="relu")(input_layer)
+    output_layers_linked = [
+        Dense(units=output_units)(hidden_layer_linked)
+        for _ in range(head_count)
+    ]
+
+    return Model(inputs=[input_layer], outputs=output_layers_linked)
+
+
+def create_sample_system(system_class, builder_class, model, name=""):
+    incoming_layers_by_name, \
+        outgoing_layers_by_name, \
+        layer_build_order_by_name = get_incoming_and_outgoing_layers(model)
+
+    input_layers, output_layers = get_input_and_output_layers(model)
+    builder = builder_class(
+        get_name_to_unlinked_layer_dict(model),
+        incoming_layers_by_name,
+        outgoing_layers_by_name,
+        layer_build_order_by_name,
+        input_layers,
+        output_layers
+    )
+
+    return system_class(name, builder)
+
+
+def create_sample_root_system(input_units=10, hidden_units=16, output_units=8):
+    return create_sample_system(RootSystem, RootSystemBuilder,
+                                create_sample_model(input_units, hidden_units, output_units))
+
+
+def create_sample_trunk_system(input_units=8, hidden_units=16, output_units=8):
+    return create_sample_system(TrunkSystem, TrunkBuilder,
+                                create_sample_model(input_units, hidden_units, output_units))
+
+
+def create_sample_branch_system(input_units=8, hidden_units=16, output_units=3, head_count=1):
+    return create_sample_system(BranchSystem, BranchSystemBuilder,
+                                create_sample_model(input_units, hidden_units, output_units, head_count))
+
+
+def create_sample_tree(name="", root_system=None, hidden_units=16, head_count=1):
+    # stands in for a NeuralTree, whose tree builder does not link systems yet
+    return SimpleNamespace(
+        name=name,
+        root_system=root_system if root_system is not None else create_sample_root_system(hidden_units=hidden_units),
+        trunk_system=create_sample_trunk_system(hidden_units=hidden_units),
+        branch_system=create_sample_branch_system(hidden_units=hidden_units, head_count=head_count)
+    )
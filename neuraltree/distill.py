@@ -0,0 +1,159 @@
+import copy
+import time
+import numpy as np
+
+from keras.layers import Dense
+from keras.models import clone_model
+
+from neuraltree.builder import \
+    get_name_to_unlinked_layer_dict, \
+    get_incoming_and_outgoing_layers, \
+    get_input_and_output_layers, \
+    get_tree_inference_model, \
+    TREE_SYSTEM_ATTR_NAMES, \
+    as_output_list, \
+    parse_out_unlinked_name, \
+    NeuralTreeBuilder
+from neuraltree.model import NeuralTree
+
+
+def get_narrowed_model(model, width_scale: float):
+    output_layer_names = {parse_out_unlinked_name(output_layer.name) for output_layer in model.outputs}
+
+    def narrow_layer(layer):
+        layer_config = layer.get_config()
+        # output layers keep their width so student heads line up with the teacher's, and transition layers
+        # keep theirs because it is fixed by the shape their reshape layer produces
+        if isinstance(layer, Dense) \
+                and layer.name not in output_layer_names \
+                and not layer.name.endswith("_transition_layer"):
+            layer_config["units"] = max(1, int(layer_config["units"] * width_scale))
+
+        return layer.__class__.from_config(layer_config)
+
+    return clone_model(model, clone_function=narrow_layer)
+
+
+def create_student_system(neural_system, width_scale: float = 0.5):
+    if not neural_system.builder.name_to_unlinked_layer:
+        raise ValueError("System, {}, has an empty builder and cannot be narrowed.".format(neural_system.name))
+
+    student_model = get_narrowed_model(neural_system.model, width_scale)
+
+    incoming_layers_by_name, \
+        outgoing_layers_by_name, \
+        layer_build_order_by_name = get_incoming_and_outgoing_layers(student_model)
+
+    input_layers, output_layers = get_input_and_output_layers(student_model)
+    student_builder = neural_system.builder.__class__(
+        get_name_to_unlinked_layer_dict(student_model),
+        incoming_layers_by_name,
+        outgoing_layers_by_name,
+        layer_build_order_by_name,
+        input_layers,
+        output_layers
+    )
+
+    return neural_system.__class__(neural_system.name + "_student", student_builder)
+
+
+def create_student_tree(teacher_tree, width_scale: float = 0.5):
+    # inference chains the systems directly, so the student is the teacher with every system narrowed
+    student_tree = copy.copy(teacher_tree)
+    student_tree.name = teacher_tree.name + "_student"
+
+    for system_attr_name in TREE_SYSTEM_ATTR_NAMES:
+        setattr(student_tree, system_attr_name,
+                create_student_system(getattr(teacher_tree, system_attr_name), width_scale))
+
+    if isinstance(teacher_tree, NeuralTree):
+        student_tree.builder = NeuralTreeBuilder(
+            student_tree.root_system.builder,
+            student_tree.trunk_system.builder,
+            student_tree.branch_system.builder,
+            teacher_tree.builder.roots_to_trunk_map,
+            teacher_tree.builder.trunk_to_branches_map
+        )
+
+    return student_tree
+
+
+def get_head_accuracy(y_true, y_pred) -> float:
+    return float(np.mean(np.argmax(y_true, axis=-1) == np.argmax(y_pred, axis=-1)))
+
+
+def get_mean_score(metric, Y: list, outputs: list) -> float:
+    return float(np.mean([metric(y_true, y_pred) for y_true, y_pred in zip(Y, outputs)]))
+
+
+def get_predict_seconds(model, X, batch_size: int) -> float:
+    # first call pays for graph setup, so it is not timed
+    model.predict(X, batch_size=batch_size)
+
+    start_time = time.perf_counter()
+    model.predict(X, batch_size=batch_size)
+    return time.perf_counter() - start_time
+
+
+class TreeDistiller:
+    def __init__(self, teacher_tree, student_tree=None, width_scale: float = 0.5, optimizer="adam", loss="mse"):
+        self.teacher_tree = teacher_tree
+        self.student_tree = student_tree \
+            if student_tree is not None \
+            else create_student_tree(teacher_tree, width_scale)
+
+        self.teacher_model = get_tree_inference_model(teacher_tree)
+        self.student_model = get_tree_inference_model(self.student_tree)
+
+        # one loss per branch head, each head is matched against the teacher's head of the same position
+        self.student_model.compile(optimizer=optimizer, loss=[loss] * len(self.student_model.outputs))
+        self.head_losses = []
+
+    def fit(self, x_batches, epochs: int = 1) -> list:
+        # x_batches is an iterable of input batches, or a callable returning a fresh iterable per epoch,
+        # teacher outputs are computed per batch and never stored
+        if isinstance(x_batches, np.ndarray):
+            raise TypeError("x_batches must yield input batches, iterating over an array yields single rows.")
+        if epochs > 1 and not callable(x_batches) and iter(x_batches) is x_batches:
+            raise TypeError("x_batches must be re-iterable or a callable, a one-shot iterator only covers one epoch.")
+
+        losses = []
+        self.head_losses = []
+        for epoch in range(epochs):
+            epoch_head_losses = []
+            for X in (x_batches() if callable(x_batches) else x_batches):
+                teacher_outputs = as_output_list(self.teacher_model.predict_on_batch(X))
+
+                batch_losses = self.student_model.train_on_batch(X, teacher_outputs)
+                # multi-head models report the total loss first, followed by each head's loss
+                if not isinstance(batch_losses, list):
+                    batch_losses = [batch_losses, batch_losses]
+                epoch_head_losses.append(batch_losses)
+
+            if not epoch_head_losses:
+                raise ValueError("x_batches yielded no batches in epoch {}.".format(epoch))
+
+            mean_batch_losses = np.mean(epoch_head_losses, axis=0)
+            losses.append(float(mean_batch_losses[0]))
+            self.head_losses.append([float(head_loss) for head_loss in mean_batch_losses[1:]])
+
+        return losses
+
+    def evaluate(self, X, Y: list, metric=get_head_accuracy, batch_size: int = 32) -> dict:
+        teacher_outputs = as_output_list(self.teacher_model.predict(X, batch_size=batch_size))
+        student_outputs = as_output_list(self.student_model.predict(X, batch_size=batch_size))
+
+        teacher_score = get_mean_score(metric, Y, teacher_outputs)
+        student_score = get_mean_score(metric, Y, student_outputs)
+
+        teacher_seconds = get_predict_seconds(self.teacher_model, X, batch_size)
+        student_seconds = get_predict_seconds(self.student_model, X, batch_size)
+
+        return {
+            "teacher_score": teacher_score,
+            "student_score": student_score,
+            "accuracy_retained": student_score / teacher_score if teacher_score else 0.,
+            "teacher_parameters": self.teacher_model.count_params(),
+            "student_parameters": self.student_model.count_params(),
+            "speedup": teacher_seconds / student_seconds if student_seconds else 0.
+        }
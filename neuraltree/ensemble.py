@@ -0,0 +1,151 @@
+import hashlib
+import json
+
+from neuraltree.builder import TREE_SYSTEM_ATTR_NAMES, get_tree_systems, as_output_list
+from neuraltree.graph import NonUniqueNameException
+from neuraltree.model import NeuralTree
+
+
+class IncompatibleSystemsException(Exception):
+    def __init__(self, tree_name, outgoing_system_name, incoming_system_name, output_shapes, input_shapes):
+        super().__init__(
+            "In tree, {}, {} outputs {} do not match {} inputs {}.".format(
+                tree_name, outgoing_system_name, output_shapes, incoming_system_name, input_shapes
+            )
+        )
+
+
+def get_layer_references(layer_references: list, position_by_layer_name: dict) -> list:
+    # references are [layer_name, node_index, tensor_index, ...] entries, as in inbound_nodes and model inputs
+    return [[position_by_layer_name[reference[0]]] + list(reference[1:]) for reference in layer_references]
+
+
+def get_positional_model_config(model_config: dict) -> dict:
+    # layer names are swapped for their position, so the config covers connectivity but not naming
+    position_by_layer_name = {
+        layer_config["name"]: position
+        for position, layer_config in enumerate(model_config["layers"])
+    }
+
+    positional_layer_configs = []
+    for layer_config in model_config["layers"]:
+        positional_layer_configs.append({
+            "class_name": layer_config["class_name"],
+            "config": {key: value for key, value in layer_config["config"].items() if key != "name"},
+            "inbound_nodes": [
+                get_layer_references(inbound_node, position_by_layer_name)
+                for inbound_node in layer_config["inbound_nodes"]
+            ]
+        })
+
+    return {
+        "layers": positional_layer_configs,
+        "input_layers": get_layer_references(model_config["input_layers"], position_by_layer_name),
+        "output_layers": get_layer_references(model_config["output_layers"], position_by_layer_name)
+    }
+
+
+def get_system_signature(neural_system) -> str:
+    model = neural_system.model
+    positional_model_config = get_positional_model_config(model.get_config())
+
+    signature = hashlib.sha1(json.dumps(positional_model_config, sort_keys=True, default=str).encode("utf-8"))
+    for weights in model.get_weights():
+        signature.update(str(weights.shape).encode("utf-8"))
+        signature.update(weights.tobytes())
+
+    return signature.hexdigest()
+
+
+def get_unbatched_shapes(shapes) -> list:
+    return [tuple(shape[1:]) for shape in as_output_list(shapes)]
+
+
+def check_tree_systems(tree: NeuralTree):
+    for outgoing_system_name, incoming_system_name in zip(TREE_SYSTEM_ATTR_NAMES, TREE_SYSTEM_ATTR_NAMES[1:]):
+        output_shapes = get_unbatched_shapes(getattr(tree, outgoing_system_name).model.output_shape)
+        input_shapes = get_unbatched_shapes(getattr(tree, incoming_system_name).model.input_shape)
+
+        if output_shapes != input_shapes:
+            raise IncompatibleSystemsException(
+                tree.name, outgoing_system_name, incoming_system_name, output_shapes, input_shapes
+            )
+
+
+# trees are evaluated as root_system.model -> trunk_system.model -> branch_system.model, so each system's
+# outputs must line up with the next system's inputs, roots_to_trunk_map and trunk_to_branches_map are not used
+class NeuralForest:
+    def __init__(self, name: str, trees: list, batch_size: int = 32, share_by_signature: bool = False):
+        self.name = name
+        self.trees = trees
+        self.batch_size = batch_size
+
+        # identical systems are always shared, equal architecture and weights only when this is set,
+        # signatures are cached, so refresh_shared_systems must be called after any system's weights change
+        self.share_by_signature = share_by_signature
+
+        for tree in self.trees:
+            check_tree_systems(tree)
+
+        self.system_key_by_id = {}
+        self.system_keys_by_tree_name = {}
+        self.refresh_shared_systems()
+
+    def refresh_shared_systems(self):
+        self.system_key_by_id = {}
+
+        for tree in self.trees:
+            for neural_system in get_tree_systems(tree):
+                if id(neural_system) in self.system_key_by_id:
+                    continue
+
+                self.system_key_by_id[id(neural_system)] = get_system_signature(neural_system) \
+                    if self.share_by_signature \
+                    else id(neural_system)
+
+        self.system_keys_by_tree_name = {}
+        for tree in self.trees:
+            if tree.name in self.system_keys_by_tree_name:
+                raise NonUniqueNameException(tree.name)
+            self.system_keys_by_tree_name[tree.name] = self.get_tree_system_keys(tree)
+
+    def get_tree_system_keys(self, tree: NeuralTree) -> list:
+        # a system's result is only reusable when everything upstream of it is shared as well
+        tree_system_keys = []
+        system_key = ()
+        for neural_system in get_tree_systems(tree):
+            system_key += (self.system_key_by_id[id(neural_system)],)
+            tree_system_keys.append(system_key)
+
+        return tree_system_keys
+
+    def get_shared_system_count(self) -> int:
+        system_keys = {
+            system_key
+            for tree_system_keys in self.system_keys_by_tree_name.values()
+            for system_key in tree_system_keys
+        }
+
+        return len(TREE_SYSTEM_ATTR_NAMES) * len(self.trees) - len(system_keys)
+
+    def predict(self, X) -> dict:
+        outputs_by_system_key = {}
+        outputs_by_tree_name = {}
+
+        for tree in self.trees:
+            outputs = X
+            for system_key, neural_system in zip(self.system_keys_by_tree_name[tree.name], get_tree_systems(tree)):
+                outputs = self.__predict_system(outputs_by_system_key, system_key, neural_system, outputs)
+
+            outputs_by_tree_name[tree.name] = outputs
+
+        return outputs_by_tree_name
+
+    def __predict_system(self, outputs_by_system_key, system_key, neural_system, inputs):
+        if system_key not in outputs_by_system_key:
+            outputs_by_system_key[system_key] = as_output_list(
+                neural_system.model.predict(inputs, batch_size=self.batch_size)
+            )
+
+        return outputs_by_system_key[system_key]
+
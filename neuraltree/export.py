@@ -0,0 +1,96 @@
+import os
+import tensorflow as tf
+import keras.backend as K
+
+from neuraltree.builder import fold_transition_layers
+from neuraltree.runner import write_io_names, read_io_names
+
+
+GRAPH_TRANSFORMS = [
+    "strip_unused_nodes",
+    "remove_nodes(op=Identity, op=CheckNumerics)",
+    "fold_constants(ignore_errors=true)",
+    "fold_batch_norms",
+    "merge_duplicate_nodes",
+    "sort_by_execution_order"
+]
+
+
+def get_input_and_output_names(model):
+    input_names = [input_layer.op.name for input_layer in model.inputs]
+    output_names = [output_layer.op.name for output_layer in model.outputs]
+
+    return input_names, output_names
+
+
+def get_frozen_graph_def(model, transforms: list = GRAPH_TRANSFORMS):
+    input_names, output_names = get_input_and_output_names(model)
+    session = K.get_session()
+
+    graph_def = tf.graph_util.convert_variables_to_constants(
+        session,
+        session.graph.as_graph_def(),
+        output_names
+    )
+    graph_def = tf.graph_util.remove_training_nodes(graph_def)
+
+    if transforms:
+        # graph transforms ship with full tensorflow builds only, a plain frozen graph is still valid without them
+        try:
+            from tensorflow.tools.graph_transforms import TransformGraph
+        except ImportError:
+            return graph_def
+
+        graph_def = TransformGraph(graph_def, input_names, output_names, transforms)
+
+    return graph_def
+
+
+def get_builder_copy(neural_builder):
+    return neural_builder.__class__(
+        dict(neural_builder.name_to_unlinked_layer),
+        {name: list(layer_names) for name, layer_names in neural_builder.incoming_layers_by_name.items()},
+        {name: list(layer_names) for name, layer_names in neural_builder.outgoing_layers_by_name.items()},
+        list(neural_builder.layer_build_order_by_name),
+        list(neural_builder.input_layers),
+        list(neural_builder.output_layers)
+    )
+
+
+def get_export_model(neural_system):
+    # folding and rebuilding happen on a copy, so the live system keeps its builder and compiled model
+    export_builder = get_builder_copy(neural_system.builder)
+    fold_transition_layers(export_builder)
+
+    previous_learning_phase = K.learning_phase()
+    K.set_learning_phase(0)
+    try:
+        return export_builder.build()
+    finally:
+        if isinstance(previous_learning_phase, int):
+            K.set_learning_phase(previous_learning_phase)
+        else:
+            # the learning phase was an unset placeholder, which set_learning_phase cannot restore
+            K._GRAPH_LEARNING_PHASES[tf.get_default_graph()] = previous_learning_phase
+
+
+def export_frozen_graph(neural_system, export_dir: str, file_name: str = "frozen_graph.pb") -> str:
+    export_model = get_export_model(neural_system)
+
+    graph_def = get_frozen_graph_def(export_model)
+    tf.train.write_graph(graph_def, export_dir, file_name, as_text=False)
+
+    frozen_graph_path = os.path.join(export_dir, file_name)
+    write_io_names(frozen_graph_path, *get_input_and_output_names(export_model))
+
+    return frozen_graph_path
+
+
+def export_tflite(frozen_graph_path: str, tflite_path: str) -> str:
+    input_names, output_names = read_io_names(frozen_graph_path)
+
+    converter = tf.lite.TFLiteConverter.from_frozen_graph(frozen_graph_path, input_names, output_names)
+    with open(tflite_path, "wb") as tflite_file:
+        tflite_file.write(converter.convert())
+
+    return tflite_path
@@ -45,9 +45,6 @@ class TrunkSystem(NeuralSystem):
     def __init__(self, name: str, builder):
         super().__init__(name, builder)
 
-        self.builder = TrunkBuilder()
-        self.model = self.builder.build()
-
 
 class NeuralTree:
     def __init__(self,
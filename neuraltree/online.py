@@ -0,0 +1,191 @@
+import json
+import queue
+import threading
+import time
+import numpy as np
+import keras.backend as K
+
+from collections import deque
+from keras.models import clone_model
+
+from neuraltree.builder import TREE_SYSTEM_ATTR_NAMES, get_tree_systems, get_tree_inference_model, as_output_list
+
+
+def iter_queue_examples(example_queue: queue.Queue, stop_event: threading.Event, poll_seconds: float = 0.1):
+    # a None item marks the end of the stream
+    while not stop_event.is_set():
+        try:
+            example = example_queue.get(timeout=poll_seconds)
+        except queue.Empty:
+            continue
+
+        if example is None:
+            return
+        yield example
+
+
+def iter_file_examples(file_path: str, stop_event: threading.Event, poll_seconds: float = 0.1):
+    # follows the file like `tail -f`, each line is a json object with "x" and "y" entries
+    partial_line = ""
+    with open(file_path) as example_file:
+        while not stop_event.is_set():
+            partial_line += example_file.readline()
+            if not partial_line.endswith("\n"):
+                time.sleep(poll_seconds)
+                continue
+
+            line, partial_line = partial_line, ""
+            if not line.strip():
+                continue
+
+            example = json.loads(line)
+            yield np.asarray(example["x"]), np.asarray(example["y"])
+
+
+def iter_source_examples(source, stop_event: threading.Event):
+    if isinstance(source, queue.Queue):
+        return iter_queue_examples(source, stop_event)
+    elif isinstance(source, str):
+        return iter_file_examples(source, stop_event)
+
+    raise TypeError("Example source must be a queue.Queue or a file path, got {}.".format(type(source).__name__))
+
+
+def iter_mini_batches(examples, batch_size: int):
+    # only one mini-batch of examples is ever held in memory
+    buffered_examples = deque(maxlen=batch_size)
+    for example in examples:
+        buffered_examples.append(example)
+        if len(buffered_examples) == batch_size:
+            X = np.stack([x for x, _ in buffered_examples])
+            Y = np.stack([y for _, y in buffered_examples])
+            buffered_examples.clear()
+            yield X, Y
+
+
+class OnlineTreeTrainer:
+    def __init__(self,
+                 tree,
+                 trainable_system_attr_names: list = ["branch_system"],
+                 batch_size: int = 32,
+                 optimizer="rmsprop",
+                 loss="mse",
+                 loss_history_size: int = 1000):
+        unknown_system_attr_names = set(trainable_system_attr_names) - set(TREE_SYSTEM_ATTR_NAMES)
+        if unknown_system_attr_names:
+            raise ValueError("Unknown systems {}, expected names from {}.".format(
+                sorted(unknown_system_attr_names), TREE_SYSTEM_ATTR_NAMES
+            ))
+
+        self.tree = tree
+        self.batch_size = batch_size
+        self.graph = K.get_session().graph
+
+        # trainable flags are only needed while the training function collects its weights,
+        # afterwards the tree's models get their original flags back
+        system_models = [neural_system.model for neural_system in get_tree_systems(tree)]
+        previous_trainable_flags = [system_model.trainable for system_model in system_models]
+        try:
+            for system_attr_name, system_model in zip(TREE_SYSTEM_ATTR_NAMES, system_models):
+                system_model.trainable = system_attr_name in trainable_system_attr_names
+
+            self.training_model = get_tree_inference_model(tree)
+            self.training_model.compile(optimizer=optimizer, loss=loss)
+            self.training_model._make_train_function()
+        finally:
+            for system_model, trainable in zip(system_models, previous_trainable_flags):
+                system_model.trainable = trainable
+
+        # two serving copies of the weights: predictions read the active one while updates go to the other
+        self.serving_models = [clone_model(self.training_model) for _ in range(2)]
+        self.reader_counts = [0, 0]
+        for serving_model in self.serving_models:
+            serving_model.set_weights(self.training_model.get_weights())
+            serving_model._make_predict_function()
+
+        self.active_index = 0
+        self.buffer_condition = threading.Condition()
+
+        self.losses = deque(maxlen=loss_history_size)
+        self.update_count = 0
+
+        self.stop_event = threading.Event()
+        self.training_thread = None
+        self.training_error = None
+
+    def predict(self, X):
+        with self.buffer_condition:
+            serving_index = self.active_index
+            self.reader_counts[serving_index] += 1
+
+        try:
+            with self.graph.as_default():
+                return self.serving_models[serving_index].predict(X, batch_size=self.batch_size)
+        finally:
+            with self.buffer_condition:
+                self.reader_counts[serving_index] -= 1
+                self.buffer_condition.notify_all()
+
+    def train_on_batch(self, X, Y) -> float:
+        # updates the training weights only, predictions keep the published ones until publish_weights
+        with self.graph.as_default():
+            batch_loss = as_output_list(self.training_model.train_on_batch(X, Y))[0]
+
+        self.losses.append(float(batch_loss))
+        self.update_count += 1
+        return float(batch_loss)
+
+    def update(self, X, Y) -> float:
+        batch_loss = self.train_on_batch(X, Y)
+        self.publish_weights()
+
+        return batch_loss
+
+    def publish_weights(self):
+        inactive_index = 1 - self.active_index
+
+        # only the updater waits, for predictions still reading the inactive copy from before the last swap
+        with self.buffer_condition:
+            self.buffer_condition.wait_for(lambda: self.reader_counts[inactive_index] == 0)
+
+        # new predictions keep reading the active copy, so the inactive one can be written without the lock
+        with self.graph.as_default():
+            self.serving_models[inactive_index].set_weights(self.training_model.get_weights())
+
+        with self.buffer_condition:
+            self.active_index = inactive_index
+
+    def run(self, examples):
+        try:
+            for X, Y in iter_mini_batches(examples, self.batch_size):
+                if self.stop_event.is_set():
+                    break
+                self.update(X, Y)
+        except Exception as error:
+            # predictions keep serving the last published weights, the failure is raised from stop()
+            self.training_error = error
+
+    def start(self, source):
+        # a second training thread would update the same training model concurrently
+        if self.training_thread is not None and self.training_thread.is_alive():
+            raise RuntimeError("Online training is already running, call stop() before starting it again.")
+
+        # source is a queue.Queue or the path of a json lines file, both stop polling once stop() is called
+        examples = iter_source_examples(source, self.stop_event)
+
+        self.stop_event.clear()
+        self.training_error = None
+        self.training_thread = threading.Thread(target=self.run, args=(examples,), daemon=True)
+        self.training_thread.start()
+
+    def stop(self, timeout: float = None):
+        self.stop_event.set()
+        if self.training_thread is not None:
+            self.training_thread.join(timeout)
+            # after a timed out join the thread is kept, so start() keeps refusing to run a second one
+            if not self.training_thread.is_alive():
+                self.training_thread = None
+
+        if self.training_error is not None:
+            training_error, self.training_error = self.training_error, None
+            raise training_error
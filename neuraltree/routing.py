@@ -0,0 +1,109 @@
+import tensorflow as tf
+import keras.backend as K
+
+from keras.layers import Layer, serialize, deserialize
+from keras.models import Model
+
+
+def get_load_balance_loss(gate_probabilities):
+    # squared coefficient of variation of each branch's total gate probability over the batch
+    importance = K.sum(gate_probabilities, axis=0)
+    return K.var(importance) / (K.square(K.mean(importance)) + K.epsilon())
+
+
+class TopKBranchRouter(Layer):
+    def __init__(self, branch_models: list, k: int = 1, load_balance_weight: float = 0.01, **kwargs):
+        super().__init__(**kwargs)
+
+        if not 0 < k <= len(branch_models):
+            raise ValueError("k must be between 1 and the number of branches, got {}.".format(k))
+
+        self.branch_models = branch_models
+        self.k = k
+        self.load_balance_weight = load_balance_weight
+
+    def build(self, input_shape):
+        self.gate_kernel = self.add_weight(
+            name="gate_kernel",
+            shape=(input_shape[-1], len(self.branch_models)),
+            initializer="glorot_uniform",
+            trainable=True
+        )
+        super().build(input_shape)
+
+    @property
+    def trainable_weights(self):
+        branch_weights = [weights for model in self.branch_models for weights in model.trainable_weights]
+        return super().trainable_weights + branch_weights
+
+    def get_gates(self, inputs) -> tuple:
+        # the softmax runs over every branch, a softmax over only the selected logits is constant for k=1
+        # and would leave the gate kernel without gradients
+        gate_probabilities = K.softmax(K.dot(inputs, self.gate_kernel))
+        top_k_gates, top_k_indices = tf.nn.top_k(gate_probabilities, k=self.k)
+
+        # scatter the k gates of each sample back into a [batch, branches] matrix that is zero elsewhere
+        batch_indices = tf.tile(tf.expand_dims(tf.range(tf.shape(inputs)[0]), 1), [1, self.k])
+        gate_indices = tf.stack([batch_indices, top_k_indices], axis=-1)
+        gates = tf.scatter_nd(gate_indices, top_k_gates, tf.shape(gate_probabilities))
+
+        return gates, gate_probabilities
+
+    def call(self, inputs):
+        gates, gate_probabilities = self.get_gates(inputs)
+        # balancing uses the full probabilities, so it can also pull samples towards unselected branches
+        self.add_loss(self.load_balance_weight * get_load_balance_loss(gate_probabilities), inputs=inputs)
+
+        output_shape = tf.concat([tf.shape(inputs)[:1], self.branch_models[0].output_shape[1:]], axis=0)
+        outputs = tf.zeros(output_shape, dtype=inputs.dtype)
+
+        for branch_index, branch_model in enumerate(self.branch_models):
+            # gather only the samples routed to this branch, run it, then scatter the weighted results back
+            sample_indices = tf.where(gates[:, branch_index] > 0)[:, 0]
+            branch_inputs = tf.gather(inputs, sample_indices)
+            branch_gates = tf.gather(gates[:, branch_index], sample_indices)
+
+            branch_outputs = branch_model(branch_inputs)
+            branch_gates = K.reshape(branch_gates, [-1] + [1] * (K.ndim(branch_outputs) - 1))
+
+            outputs += tf.scatter_nd(
+                K.expand_dims(sample_indices, 1),
+                branch_outputs * branch_gates,
+                tf.cast(output_shape, tf.int64)
+            )
+
+        return outputs
+
+    def compute_output_shape(self, input_shape):
+        return (input_shape[0],) + tuple(self.branch_models[0].output_shape[1:])
+
+    def get_config(self):
+        # branch weights are saved with the layer, since they are part of its trainable weights
+        config = super().get_config()
+        config.update({
+            "branch_models": [serialize(branch_model) for branch_model in self.branch_models],
+            "k": self.k,
+            "load_balance_weight": self.load_balance_weight
+        })
+        return config
+
+    @classmethod
+    def from_config(cls, config):
+        config = dict(config)
+        branch_models = [deserialize(branch_model_config) for branch_model_config in config.pop("branch_models")]
+        return cls(branch_models, **config)
+
+
+def get_routed_model(trunk_model, branch_systems: list, k: int = 1, load_balance_weight: float = 0.01):
+    # every branch system must take the trunk output shape and produce the same output shape
+    if len(trunk_model.outputs) != 1:
+        raise ValueError("Branch routing needs a trunk with one output, got {}.".format(len(trunk_model.outputs)))
+
+    router = TopKBranchRouter(
+        [branch_system.model for branch_system in branch_systems],
+        k=k,
+        load_balance_weight=load_balance_weight,
+        name=trunk_model.name + "_branch_router"
+    )
+
+    return Model(inputs=trunk_model.inputs, outputs=[router(trunk_model.outputs[0])])
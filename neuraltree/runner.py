@@ -0,0 +1,47 @@
+import tensorflow as tf
+
+
+def get_io_file_path(frozen_graph_path: str) -> str:
+    return frozen_graph_path + ".io"
+
+
+def write_io_names(frozen_graph_path: str, input_names: list, output_names: list):
+    with open(get_io_file_path(frozen_graph_path), "w") as io_file:
+        io_file.write(",".join(input_names) + "\n")
+        io_file.write(",".join(output_names) + "\n")
+
+
+def read_io_names(frozen_graph_path: str) -> tuple:
+    with open(get_io_file_path(frozen_graph_path)) as io_file:
+        input_names = io_file.readline().strip().split(",")
+        output_names = io_file.readline().strip().split(",")
+
+    return input_names, output_names
+
+
+# kept free of keras and the builders so that serving only needs tensorflow and the exported graph
+class FrozenTreeRunner:
+    def __init__(self, frozen_graph_path: str):
+        input_names, output_names = read_io_names(frozen_graph_path)
+
+        graph_def = tf.GraphDef()
+        with tf.gfile.GFile(frozen_graph_path, "rb") as graph_file:
+            graph_def.ParseFromString(graph_file.read())
+
+        self.graph = tf.Graph()
+        with self.graph.as_default():
+            tf.import_graph_def(graph_def, name="")
+
+        self.input_tensors = [self.graph.get_tensor_by_name(name + ":0") for name in input_names]
+        self.output_tensors = [self.graph.get_tensor_by_name(name + ":0") for name in output_names]
+
+        self.session = tf.Session(graph=self.graph)
+
+    def predict(self, X) -> list:
+        if not isinstance(X, list):
+            X = [X]
+
+        return self.session.run(self.output_tensors, feed_dict=dict(zip(self.input_tensors, X)))
+
+    def close(self):
+        self.session.close()
@@ -1,7 +1,9 @@
+import numpy as np
+
 from keras.layers import Input, Dense
 from keras.models import Model
 
-from neuraltree.builder import RootSystemBuilder
+from neuraltree.builder import RootSystemBuilder, fold_transition_layers, get_chained_model
 
 
 root_1_input_layer = Input(shape=(1,))
@@ -101,3 +103,52 @@ def test_root_system_builder_import_root():
     }
     assert root_builder_1.input_layers == [root_1_input_layer, root_2_input_layer]
     assert root_builder_1.output_layers == [root_1_output_layer]
+
+
+def test_fold_transition_layers():
+    input_layer = Input(shape=(3,))
+    hidden_layer = Dense(units=5)
+    hidden_layer(input_layer)
+
+    transition_layer_name = "attach_to_{}_transition_layer".format(hidden_layer.name)
+    reshaped_transition_layer_name = transition_layer_name + "_reshaped"
+
+    root_builder = RootSystemBuilder(
+        name_to_unlinked_layer={input_layer.name: input_layer, hidden_layer.name: hidden_layer},
+        incoming_layers_by_name={
+            hidden_layer.name: [input_layer.name, reshaped_transition_layer_name],
+            reshaped_transition_layer_name: [transition_layer_name],
+            transition_layer_name: ["attach"]
+        },
+        outgoing_layers_by_name={
+            input_layer.name: [hidden_layer.name],
+            "attach": [transition_layer_name],
+            transition_layer_name: [reshaped_transition_layer_name],
+            reshaped_transition_layer_name: [hidden_layer.name]
+        },
+        layer_build_order_by_name=[],
+        input_layers=[input_layer],
+        output_layers=[hidden_layer]
+    )
+
+    assert fold_transition_layers(root_builder) == [reshaped_transition_layer_name]
+    assert root_builder.incoming_layers_by_name == {
+        hidden_layer.name: [input_layer.name, transition_layer_name],
+        transition_layer_name: ["attach"]
+    }
+    assert root_builder.outgoing_layers_by_name == {
+        input_layer.name: [hidden_layer.name],
+        "attach": [transition_layer_name],
+        transition_layer_name: [hidden_layer.name]
+    }
+
+
+def test_get_chained_model():
+    root_input_layer = Input(shape=(50,))
+    root_model = Model(inputs=[root_input_layer], outputs=[Dense(units=8)(root_input_layer)])
+    trunk_input_layer = Input(shape=(8,))
+    trunk_model = Model(inputs=[trunk_input_layer], outputs=[Dense(units=4)(trunk_input_layer)])
+
+    chained_model = get_chained_model([root_model, trunk_model])
+
+    assert chained_model.predict(np.random.rand(3, 50)).shape == (3, 4)
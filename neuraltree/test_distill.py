@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from keras.layers import Input, Dense, Reshape, Flatten
+from keras.models import Model
+
+from neuraltree.builder import RootSystemBuilder, TrunkBuilder
+from neuraltree.conftest import create_sample_model, create_sample_root_system, create_sample_tree
+from neuraltree.distill import \
+    get_narrowed_model, \
+    get_head_accuracy, \
+    create_student_system, \
+    create_student_tree, \
+    TreeDistiller
+from neuraltree.model import RootSystem, TrunkSystem
+
+
+def test_get_narrowed_model():
+    model = create_sample_model(50, 20, 4)
+    narrowed_model = get_narrowed_model(model, 0.5)
+
+    assert [layer.units for layer in narrowed_model.layers[1:]] == [10, 4]
+    assert narrowed_model.count_params() < model.count_params()
+
+
+def test_get_narrowed_model_keeps_transition_layers():
+    input_layer = Input(shape=(4,))
+    transition_layer = Dense(units=6, name="attach_to_hardpoint_transition_layer")
+    reshaped_transition_layer = Reshape(target_shape=(2, 3), name=transition_layer.name + "_reshaped")
+    output_layer_linked = Dense(units=2)(Flatten()(reshaped_transition_layer(transition_layer(input_layer))))
+    model = Model(inputs=[input_layer], outputs=[output_layer_linked])
+
+    narrowed_model = get_narrowed_model(model, 0.5)
+
+    assert narrowed_model.get_layer(transition_layer.name).units == 6
+    assert narrowed_model.predict(np.random.rand(3, 4)).shape == (3, 2)
+
+
+def test_create_student_system():
+    root_system = create_sample_root_system(50, 20, 4)
+    root_system.name = "root"
+
+    student_system = create_student_system(root_system, 0.5)
+
+    assert RootSystem == type(student_system)
+    assert RootSystemBuilder == type(student_system.builder)
+    assert student_system.name == "root_student"
+    assert student_system.model.count_params() < root_system.model.count_params()
+
+
+def test_create_student_system_rejects_empty_builder():
+    empty_system = SimpleNamespace(name="trunk", builder=SimpleNamespace(name_to_unlinked_layer={}))
+
+    with pytest.raises(ValueError):
+        create_student_system(empty_system)
+
+
+def test_create_student_tree():
+    teacher_tree = create_sample_tree("teacher", head_count=2)
+
+    student_tree = create_student_tree(teacher_tree, 0.5)
+
+    assert student_tree.name == "teacher_student"
+    assert TrunkSystem == type(student_tree.trunk_system)
+    assert TrunkBuilder == type(student_tree.trunk_system.builder)
+    for system_attr_name in ["root_system", "trunk_system", "branch_system"]:
+        assert getattr(student_tree, system_attr_name).model.count_params() < \
+            getattr(teacher_tree, system_attr_name).model.count_params()
+
+
+def test_tree_distiller():
+    distiller = TreeDistiller(create_sample_tree(hidden_units=32, head_count=2), width_scale=0.25)
+
+    X = np.random.rand(64, 10)
+    losses = distiller.fit(lambda: (X[i:i + 16] for i in range(0, len(X), 16)), epochs=2)
+
+    assert len(losses) == 2
+    assert all(np.isfinite(loss) for loss in losses)
+    assert [len(epoch_head_losses) for epoch_head_losses in distiller.head_losses] == [2, 2]
+
+    Y = [np.eye(3)[np.random.randint(3, size=64)] for _ in range(2)]
+    report = distiller.evaluate(X, Y)
+
+    assert report["student_parameters"] < report["teacher_parameters"]
+    assert report["accuracy_retained"] >= 0.
+    assert report["speedup"] > 0.
+
+
+def test_tree_distiller_streams_one_shot_iterator_for_one_epoch():
+    distiller = TreeDistiller(create_sample_tree(hidden_units=32))
+    X = np.random.rand(64, 10)
+
+    assert len(distiller.fit((X[i:i + 16] for i in range(0, len(X), 16)))) == 1
+
+    with pytest.raises(TypeError):
+        distiller.fit((X[i:i + 16] for i in range(0, len(X), 16)), epochs=2)
+
+
+def test_tree_distiller_rejects_array():
+    distiller = TreeDistiller(create_sample_tree(hidden_units=32))
+
+    with pytest.raises(TypeError):
+        distiller.fit(np.random.rand(64, 10))
+
+
+def test_get_head_accuracy():
+    y_true = np.array([[1., 0.], [0., 1.], [1., 0.], [0., 1.]])
+    y_pred = np.array([[.9, .1], [.2, .8], [.3, .7], [.4, .6]])
+
+    assert get_head_accuracy(y_true, y_pred) == 0.75
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from keras.layers import Input, Dense
+from keras.models import Model
+
+from neuraltree.builder import RootSystemBuilder
+from neuraltree.conftest import create_sample_system, create_sample_root_system, create_sample_tree
+from neuraltree.ensemble import NeuralForest, IncompatibleSystemsException, get_system_signature
+from neuraltree.model import RootSystem
+
+
+class CountingModel:
+    def __init__(self, model):
+        self.model = model
+        self.predict_count = 0
+
+    def predict(self, inputs, batch_size=None):
+        self.predict_count += 1
+        return self.model.predict(inputs, batch_size=batch_size)
+
+
+def test_system_signature_ignores_layer_names():
+    system_1 = create_sample_root_system()
+    system_2 = create_sample_root_system()
+    system_2.model.set_weights(system_1.model.get_weights())
+
+    assert get_system_signature(system_1) == get_system_signature(system_2)
+
+
+def test_system_signature_ignores_positional_looking_layer_names():
+    system_1 = create_sample_root_system()
+
+    input_layer = Input(shape=(10,), name="layer_2")
+    hidden_layer_linked = Dense(units=16, activation="relu", name="layer_0")(input_layer)
+    output_layer_linked = Dense(units=8, name="layer_1")(hidden_layer_linked)
+    system_2 = create_sample_system(
+        RootSystem, RootSystemBuilder, Model(inputs=[input_layer], outputs=[output_layer_linked])
+    )
+    system_2.model.set_weights(system_1.model.get_weights())
+
+    assert get_system_signature(system_1) == get_system_signature(system_2)
+
+
+def test_system_signature_depends_on_weights():
+    system_1 = create_sample_root_system()
+    system_2 = create_sample_root_system()
+    system_2.model.set_weights([weights + 1. for weights in system_1.model.get_weights()])
+
+    assert get_system_signature(system_1) != get_system_signature(system_2)
+
+
+def test_system_signature_depends_on_connectivity():
+    input_layer = Input(shape=(4,))
+    hidden_layer = Dense(units=4)
+    output_layer = Dense(units=4)
+
+    hidden_layer_linked = hidden_layer(input_layer)
+    chained_model = Model(inputs=[input_layer], outputs=[hidden_layer_linked, output_layer(hidden_layer_linked)])
+    parallel_model = Model(inputs=[input_layer], outputs=[hidden_layer_linked, output_layer(input_layer)])
+
+    assert get_system_signature(SimpleNamespace(model=chained_model)) != \
+        get_system_signature(SimpleNamespace(model=parallel_model))
+
+
+def test_forest_predicts_shared_root_once():
+    root_system = create_sample_root_system()
+    trees = [create_sample_tree("tree_{}".format(i), root_system=root_system) for i in range(3)]
+    forest = NeuralForest("", trees)
+
+    root_system.model = CountingModel(root_system.model)
+    outputs_by_tree_name = forest.predict(np.random.rand(8, 10))
+
+    assert root_system.model.predict_count == 1
+    assert forest.get_shared_system_count() == 2
+    assert sorted(outputs_by_tree_name.keys()) == ["tree_0", "tree_1", "tree_2"]
+    for outputs in outputs_by_tree_name.values():
+        assert outputs[0].shape == (8, 3)
+
+
+def test_forest_stops_sharing_diverged_systems():
+    root_system_1 = create_sample_root_system()
+    root_system_2 = create_sample_root_system()
+    root_system_2.model.set_weights(root_system_1.model.get_weights())
+
+    forest = NeuralForest("", [
+        create_sample_tree("tree_1", root_system=root_system_1),
+        create_sample_tree("tree_2", root_system=root_system_2)
+    ], share_by_signature=True)
+    assert forest.get_shared_system_count() == 1
+
+    root_system_2.model.set_weights([weights + 1. for weights in root_system_2.model.get_weights()])
+    assert forest.get_shared_system_count() == 1
+
+    forest.refresh_shared_systems()
+    X = np.random.rand(8, 10)
+    outputs_by_tree_name = forest.predict(X)
+
+    assert forest.get_shared_system_count() == 0
+    assert not np.allclose(root_system_1.model.predict(X), root_system_2.model.predict(X))
+    assert outputs_by_tree_name["tree_2"][0].shape == (8, 3)
+
+
+def test_forest_shares_only_identical_systems_by_default():
+    root_system_1 = create_sample_root_system()
+    root_system_2 = create_sample_root_system()
+    root_system_2.model.set_weights(root_system_1.model.get_weights())
+
+    forest = NeuralForest("", [
+        create_sample_tree("tree_1", root_system=root_system_1),
+        create_sample_tree("tree_2", root_system=root_system_2)
+    ])
+
+    assert forest.get_shared_system_count() == 0
+
+
+def test_forest_rejects_incompatible_systems():
+    tree = create_sample_tree("tree", root_system=create_sample_root_system(output_units=5))
+
+    with pytest.raises(IncompatibleSystemsException):
+        NeuralForest("", [tree])
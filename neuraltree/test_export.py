@@ -0,0 +1,58 @@
+import numpy as np
+import tensorflow as tf
+import keras.backend as K
+
+from keras.layers import Input, Dense, Reshape
+from keras.models import Model
+
+from neuraltree.builder import RootSystemBuilder
+from neuraltree.conftest import create_sample_system, create_sample_root_system
+from neuraltree.export import export_frozen_graph
+from neuraltree.model import RootSystem
+from neuraltree.runner import FrozenTreeRunner, read_io_names
+
+
+def test_export_frozen_graph_round_trip(tmpdir):
+    root_system = create_sample_root_system()
+    model = root_system.model
+    incoming_layers_by_name = dict(root_system.builder.incoming_layers_by_name)
+    learning_phase = K.learning_phase()
+
+    frozen_graph_path = export_frozen_graph(root_system, str(tmpdir))
+
+    assert root_system.model is model
+    assert root_system.builder.incoming_layers_by_name == incoming_layers_by_name
+    assert K.learning_phase() is learning_phase
+    assert len(read_io_names(frozen_graph_path)[1]) == 1
+
+    X = np.random.rand(5, 10).astype("float32")
+    runner = FrozenTreeRunner(frozen_graph_path)
+    try:
+        assert np.allclose(runner.predict(X)[0], model.predict(X), atol=1e-5)
+    finally:
+        runner.close()
+
+
+def test_export_frozen_graph_folds_transition_layers(tmpdir):
+    input_layer = Input(shape=(4,))
+    transition_layer = Dense(units=6, activation="relu", name="attach_to_hidden_transition_layer")
+    reshaped_transition_layer = Reshape(target_shape=(6,), name=transition_layer.name + "_reshaped")
+    output_layer_linked = Dense(units=3, name="hidden")(reshaped_transition_layer(transition_layer(input_layer)))
+    root_system = create_sample_system(
+        RootSystem, RootSystemBuilder, Model(inputs=[input_layer], outputs=[output_layer_linked])
+    )
+
+    frozen_graph_path = export_frozen_graph(root_system, str(tmpdir))
+
+    graph_def = tf.GraphDef()
+    with tf.gfile.GFile(frozen_graph_path, "rb") as graph_file:
+        graph_def.ParseFromString(graph_file.read())
+    assert not any(reshaped_transition_layer.name in node.name for node in graph_def.node)
+    assert root_system.builder.outgoing_layers_by_name[reshaped_transition_layer.name] == ["hidden"]
+
+    X = np.random.rand(5, 4).astype("float32")
+    runner = FrozenTreeRunner(frozen_graph_path)
+    try:
+        assert np.allclose(runner.predict(X)[0], root_system.model.predict(X), atol=1e-5)
+    finally:
+        runner.close()
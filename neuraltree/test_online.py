@@ -0,0 +1,119 @@
+import json
+import queue
+import threading
+import numpy as np
+import pytest
+
+from neuraltree.conftest import create_sample_tree
+from neuraltree.online import iter_queue_examples, iter_file_examples, iter_mini_batches, OnlineTreeTrainer
+
+
+class WatchedQueue(queue.Queue):
+    def __init__(self):
+        super().__init__()
+        self.get_called = threading.Event()
+
+    def get(self, *args, **kwargs):
+        self.get_called.set()
+        return super().get(*args, **kwargs)
+
+
+def test_iter_mini_batches_drops_incomplete_batch():
+    examples = [(np.full(3, i), np.array([i])) for i in range(7)]
+
+    mini_batches = list(iter_mini_batches(examples, 3))
+
+    assert len(mini_batches) == 2
+    assert mini_batches[0][0].shape == (3, 3)
+    assert mini_batches[1][1].tolist() == [[3], [4], [5]]
+
+
+def test_iter_queue_examples_stops_at_sentinel():
+    example_queue = queue.Queue()
+    for i in range(4):
+        example_queue.put((np.full(2, i), np.array([i])))
+    example_queue.put(None)
+
+    examples = list(iter_queue_examples(example_queue, threading.Event()))
+
+    assert [y.tolist() for _, y in examples] == [[0], [1], [2], [3]]
+
+
+def test_iter_file_examples(tmpdir):
+    file_path = str(tmpdir.join("examples.jsonl"))
+    with open(file_path, "w") as example_file:
+        for i in range(2):
+            example_file.write(json.dumps({"x": [i, i], "y": [i]}) + "\n")
+
+    stop_event = threading.Event()
+    examples = iter_file_examples(file_path, stop_event)
+    first_examples = [next(examples), next(examples)]
+    stop_event.set()
+
+    assert [x.tolist() for x, _ in first_examples] == [[0, 0], [1, 1]]
+
+
+def test_online_tree_trainer_updates_only_selected_systems():
+    tree = create_sample_tree()
+    trainer = OnlineTreeTrainer(tree, batch_size=8)
+
+    root_weights = tree.root_system.model.get_weights()
+    trunk_weights = tree.trunk_system.model.get_weights()
+    branch_weights = tree.branch_system.model.get_weights()
+
+    X = np.random.rand(8, 10)
+    predictions = trainer.predict(X)
+    trainer.train_on_batch(X, np.random.rand(8, 3))
+
+    assert all(np.array_equal(old, new) for old, new in zip(root_weights, tree.root_system.model.get_weights()))
+    assert all(np.array_equal(old, new) for old, new in zip(trunk_weights, tree.trunk_system.model.get_weights()))
+    assert not all(np.array_equal(old, new) for old, new in zip(branch_weights, tree.branch_system.model.get_weights()))
+    assert all(system.model.trainable for system in [tree.root_system, tree.trunk_system, tree.branch_system])
+
+    # training alone does not reach predictions, they switch to the new weights once published
+    assert np.allclose(trainer.predict(X), predictions)
+    trainer.publish_weights()
+    assert np.allclose(trainer.predict(X), trainer.training_model.predict(X), atol=1e-5)
+    assert not np.allclose(trainer.predict(X), predictions)
+
+
+def test_online_tree_trainer_rejects_unknown_systems():
+    with pytest.raises(ValueError):
+        OnlineTreeTrainer(create_sample_tree(), trainable_system_attr_names=["branches"])
+
+
+def test_online_tree_trainer_stops_on_idle_queue():
+    trainer = OnlineTreeTrainer(create_sample_tree(), batch_size=8)
+    example_queue = WatchedQueue()
+
+    trainer.start(example_queue)
+    assert example_queue.get_called.wait(timeout=5.)
+    trainer.stop(timeout=5.)
+
+    assert trainer.training_thread is None
+    assert trainer.update_count == 0
+
+
+def test_online_tree_trainer_rejects_second_start():
+    trainer = OnlineTreeTrainer(create_sample_tree(), batch_size=8)
+    example_queue = WatchedQueue()
+
+    trainer.start(example_queue)
+    try:
+        with pytest.raises(RuntimeError):
+            trainer.start(example_queue)
+    finally:
+        trainer.stop(timeout=5.)
+
+
+def test_online_tree_trainer_raises_training_error_from_stop(tmpdir):
+    file_path = str(tmpdir.join("examples.jsonl"))
+    with open(file_path, "w") as example_file:
+        example_file.write("not json\n")
+
+    trainer = OnlineTreeTrainer(create_sample_tree(), batch_size=8)
+    trainer.start(file_path)
+    trainer.training_thread.join(timeout=5.)
+
+    with pytest.raises(ValueError):
+        trainer.stop()
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import keras.backend as K
+
+from keras.layers import Input, Dense
+from keras.models import Model, load_model
+
+from neuraltree.routing import TopKBranchRouter, get_load_balance_loss, get_routed_model
+
+
+def create_branch_model(output_units):
+    input_layer = Input(shape=(8,))
+    output_layer_linked = Dense(units=output_units)(input_layer)
+
+    return Model(inputs=[input_layer], outputs=[output_layer_linked])
+
+
+def create_routed_model(branch_count, k):
+    input_layer = Input(shape=(8,))
+    router = TopKBranchRouter([create_branch_model(3) for _ in range(branch_count)], k=k)
+
+    return Model(inputs=[input_layer], outputs=[router(input_layer)])
+
+
+def test_top_k_branch_router_output_shape():
+    routed_model = create_routed_model(4, 2)
+
+    assert routed_model.predict(np.random.rand(16, 8)).shape == (16, 3)
+
+
+def test_top_k_branch_router_with_single_branch_matches_branch():
+    routed_model = create_routed_model(1, 1)
+    branch_model = routed_model.layers[-1].branch_models[0]
+
+    X = np.random.rand(16, 8)
+    assert np.allclose(routed_model.predict(X), branch_model.predict(X), atol=1e-5)
+
+
+def test_top_k_branch_router_rejects_invalid_k():
+    with pytest.raises(ValueError):
+        TopKBranchRouter([create_branch_model(3)], k=2)
+
+
+def test_get_load_balance_loss_is_zero_for_uniform_gates():
+    uniform_gates = K.constant(np.full((16, 4), 0.25))
+
+    assert abs(K.eval(get_load_balance_loss(uniform_gates))) < 1e-6
+
+
+def test_get_routed_model_adds_load_balance_loss():
+    trunk_input_layer = Input(shape=(4,))
+    trunk_model = Model(inputs=[trunk_input_layer], outputs=[Dense(units=8)(trunk_input_layer)])
+    branch_systems = [SimpleNamespace(model=create_branch_model(3)) for _ in range(4)]
+
+    routed_model = get_routed_model(trunk_model, branch_systems, k=2)
+
+    assert len(routed_model.losses) == 1
+    assert routed_model.predict(np.random.rand(16, 4)).shape == (16, 3)
+
+
+def test_get_routed_model_rejects_multiple_trunk_outputs():
+    trunk_input_layer = Input(shape=(4,))
+    trunk_model = Model(
+        inputs=[trunk_input_layer],
+        outputs=[Dense(units=8)(trunk_input_layer), Dense(units=8)(trunk_input_layer)]
+    )
+
+    with pytest.raises(ValueError):
+        get_routed_model(trunk_model, [SimpleNamespace(model=create_branch_model(3))])
+
+
+def test_top_k_branch_router_save_and_load(tmpdir):
+    routed_model = create_routed_model(3, 1)
+    model_path = str(tmpdir.join("routed_model.h5"))
+    routed_model.save(model_path)
+
+    loaded_model = load_model(model_path, custom_objects={"TopKBranchRouter": TopKBranchRouter})
+
+    X = np.random.rand(16, 8)
+    assert np.allclose(loaded_model.predict(X), routed_model.predict(X), atol=1e-5)
+
+
+def test_top_k_branch_router_trains_gate_kernel_with_single_branch_selected():
+    routed_model = create_routed_model(4, 1)
+    routed_model.compile(optimizer="sgd", loss="mse")
+    router = routed_model.layers[-1]
+    gate_kernel = K.get_value(router.gate_kernel)
+
+    routed_model.train_on_batch(np.random.rand(16, 8), np.random.rand(16, 3))
+
+    assert not np.allclose(K.get_value(router.gate_kernel), gate_kernel)